@@ -70,6 +70,12 @@ class AbstractCompiler(ABC, Generic[Table, Result]):
         )
 
     def _execute_statement(self, statement_root: Node) -> Result:
+        table, columns = self._get_table_and_columns(statement_root)
+        return self.select_columns_from_table(table, columns)
+
+    def _get_table_and_columns(
+        self, statement_root: Node
+    ) -> tuple[Table, list[str]]:
         from_node = statement_root.children[0]
         select_node = statement_root.children[1]
 
@@ -83,7 +89,7 @@ class AbstractCompiler(ABC, Generic[Table, Result]):
         for column_node in column_list_node.children:
             token = column_node.name
             columns.append(token.get_value())
-        return self.select_columns_from_table(table, columns)
+        return table, columns
 
     def get_table_from_node(self, table_node: Node) -> Table:
         id_values = []
@@ -91,7 +97,9 @@ class AbstractCompiler(ABC, Generic[Table, Result]):
             token = child.name
             if isinstance(token, tokens.IdentifierToken):
                 id_values.append(token.get_value())
+        return self.get_table_from_ids(id_values)
 
+    def get_table_from_ids(self, id_values: list[str]) -> Table:
         id_count = len(id_values)
         if id_count == 1:
             return self.get_table_from_1_id(id_values[0])
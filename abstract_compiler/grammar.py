@@ -0,0 +1,170 @@
+from .tokens import TokenType
+
+
+class Grammar:
+    RULE_SEPARATOR = "::="
+    ALTERNATIVE_SEPARATOR = "|"
+    EMPTY = "ε"
+    NO_PRODUCTION = -1
+
+    def __init__(self, specification: str):
+        self.terminals: list[TokenType] = []
+        self.nonterminals: list[str] = []
+        rules: list[tuple[str, list[list[str]]]] = []
+        for line in specification.strip().splitlines():
+            if self.RULE_SEPARATOR not in line:
+                continue
+            name, alternatives = line.split(self.RULE_SEPARATOR)
+            rules.append((
+                name.strip(),
+                [
+                    alternative.split()
+                    for alternative in alternatives.split(
+                        self.ALTERNATIVE_SEPARATOR
+                    )
+                ],
+            ))
+            self.nonterminals.append(name.strip())
+        for _, alternatives in rules:
+            for alternative in alternatives:
+                for symbol in alternative:
+                    if self._is_terminal_name(symbol):
+                        token_type = self._get_token_type(symbol)
+                        if token_type not in self.terminals:
+                            self.terminals.append(token_type)
+
+        self.end = len(self.terminals)
+        self.kinds = {
+            token_type: kind for kind, token_type in enumerate(self.terminals)
+        }
+        self.start = self.end + 1
+
+        self.productions: list[tuple[int, tuple[int, ...]]] = []
+        for name, alternatives in rules:
+            nonterminal = self._get_symbol(name)
+            for alternative in alternatives:
+                self.productions.append((
+                    nonterminal,
+                    tuple(
+                        self._get_symbol(symbol)
+                        for symbol in alternative
+                        if symbol != self.EMPTY
+                    ),
+                ))
+
+        self.first, self.nullable = self._compute_first()
+        self.follow = self._compute_follow()
+        self.table = self._compute_table()
+
+    def is_terminal(self, symbol: int) -> bool:
+        return symbol <= self.end
+
+    def get_name(self, symbol: int) -> str:
+        if self.is_terminal(symbol):
+            return "$" if symbol == self.end else self.terminals[symbol]
+        return self.nonterminals[symbol - self.start]
+
+    def get_production(self, nonterminal: int, kind: int) -> int:
+        return self.table[nonterminal - self.start][kind]
+
+    def get_expected_kinds(self, nonterminal: int) -> list[int]:
+        return [
+            kind
+            for kind, production in enumerate(
+                self.table[nonterminal - self.start]
+            )
+            if production != self.NO_PRODUCTION
+        ]
+
+    def _is_terminal_name(self, symbol: str) -> bool:
+        return symbol.startswith("<") and symbol.endswith(">")
+
+    def _get_token_type(self, name: str) -> TokenType:
+        try:
+            return TokenType[name[1:-1]]
+        except KeyError:
+            raise ValueError(f"Undefined terminal '{name}'") from None
+
+    def _get_symbol(self, name: str) -> int:
+        if self._is_terminal_name(name):
+            return self.kinds[self._get_token_type(name)]
+        if name not in self.nonterminals:
+            raise ValueError(f"Undefined nonterminal '{name}'")
+        return self.start + self.nonterminals.index(name)
+
+    def _sequence_first(
+        self,
+        symbols: tuple[int, ...],
+        first: list[set[int]],
+        nullable: list[bool],
+    ) -> tuple[set[int], bool]:
+        sequence_first = set()
+        for symbol in symbols:
+            if self.is_terminal(symbol):
+                sequence_first.add(symbol)
+                return sequence_first, False
+            sequence_first |= first[symbol - self.start]
+            if not nullable[symbol - self.start]:
+                return sequence_first, False
+        return sequence_first, True
+
+    def _compute_first(self) -> tuple[list[set[int]], list[bool]]:
+        first = [set() for _ in self.nonterminals]
+        nullable = [False for _ in self.nonterminals]
+        changed = True
+        while changed:
+            changed = False
+            for nonterminal, symbols in self.productions:
+                index = nonterminal - self.start
+                symbols_first, symbols_nullable = self._sequence_first(
+                    symbols, first, nullable
+                )
+                if not symbols_first <= first[index]:
+                    first[index] |= symbols_first
+                    changed = True
+                if symbols_nullable and not nullable[index]:
+                    nullable[index] = True
+                    changed = True
+        return first, nullable
+
+    def _compute_follow(self) -> list[set[int]]:
+        follow = [set() for _ in self.nonterminals]
+        follow[0].add(self.end)
+        changed = True
+        while changed:
+            changed = False
+            for nonterminal, symbols in self.productions:
+                for position, symbol in enumerate(symbols):
+                    if self.is_terminal(symbol):
+                        continue
+                    index = symbol - self.start
+                    rest_first, rest_nullable = self._sequence_first(
+                        symbols[position + 1:], self.first, self.nullable
+                    )
+                    if rest_nullable:
+                        rest_first |= follow[nonterminal - self.start]
+                    if not rest_first <= follow[index]:
+                        follow[index] |= rest_first
+                        changed = True
+        return follow
+
+    def _compute_table(self) -> list[list[int]]:
+        table = [
+            [self.NO_PRODUCTION] * (self.end + 1) for _ in self.nonterminals
+        ]
+        for production, (nonterminal, symbols) in enumerate(self.productions):
+            index = nonterminal - self.start
+            kinds, symbols_nullable = self._sequence_first(
+                symbols, self.first, self.nullable
+            )
+            if symbols_nullable:
+                kinds |= self.follow[index]
+            for kind in kinds:
+                if table[index][kind] != self.NO_PRODUCTION:
+                    raise ValueError(
+                        f"Grammar is not LL(1): conflict on "
+                        f"'{self.get_name(kind)}' for nonterminal "
+                        f"'{self.nonterminals[index]}'"
+                    )
+                table[index][kind] = production
+        return table
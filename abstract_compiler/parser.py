@@ -2,10 +2,11 @@ from enum import StrEnum
 
 from anytree import Node
 
-from . import tokens
 from .exceptions import SyntacticError
+from .grammar import Grammar
 from .lexeme_locator import LexemeLocator
-from .tokens import AbstractToken
+from .lexer import Lexer
+from .tokens import AbstractToken, TokenType
 
 
 class NonTerminalNodeType(StrEnum):
@@ -16,85 +17,139 @@ class NonTerminalNodeType(StrEnum):
     TABLE = "TABLE"
 
 
+GRAMMAR = """
+statement           ::= select_statement
+select_statement    ::= from select
+from                ::= <FROM> table
+select              ::= <SELECT> column_list
+column_list         ::= <ID> column_list_tail
+column_list_tail    ::= <ID> column_list_tail | ε
+table               ::= <ID> table_schema
+table_schema        ::= <DOT> <ID> table_database | ε
+table_database      ::= <DOT> <ID> | ε
+"""
+
+NODE_TYPES = {
+    "select_statement": NonTerminalNodeType.SELECT_STATEMENT,
+    "from": NonTerminalNodeType.FROM,
+    "select": NonTerminalNodeType.SELECT,
+    "column_list": NonTerminalNodeType.COLUMN_LIST,
+    "table": NonTerminalNodeType.TABLE,
+}
+
+TOKEN_CLASSES: dict[TokenType, type[AbstractToken]] = {
+    token_class.token_type: token_class for token_class in Lexer.TOKEN_CLASSES
+}
+
+
 class Parser:
+    grammar = Grammar(GRAMMAR)
+
+    node_types: list[NonTerminalNodeType | None] = [
+        NODE_TYPES.get(nonterminal) for nonterminal in grammar.nonterminals
+    ]
+
     def __init__(self, token_list: list[AbstractToken]):
         self.tokens = token_list
-        self.current_node = None
-        self.previous_node = None
+        self.position = 0
         self.syntax_tree = None
+        self.expected_tokens: (
+            dict[TokenType, NonTerminalNodeType] | None
+        ) = None
 
     def parse(self) -> Node:
-        return self._statement()
+        grammar = self.grammar
+        stack: list[tuple[int, Node | None]] = [
+            (grammar.end, None), (grammar.start, None)
+        ]
+        while len(stack) > 0:
+            symbol, parent = stack[-1]
+            token = self._peek_next_token()
+            kind = grammar.end if token is None else grammar.kinds[
+                token.token_type
+            ]
+            if kind == grammar.end and self.expected_tokens is None:
+                self.expected_tokens = self._get_expected_tokens(stack)
+
+            if grammar.is_terminal(symbol):
+                if symbol != kind:
+                    self._raise_syntactic_error(stack, token, [symbol])
+                stack.pop()
+                if token is not None:
+                    Node(token, parent=parent)
+                    self.position += 1
+                continue
+
+            production = grammar.get_production(symbol, kind)
+            if production == grammar.NO_PRODUCTION:
+                self._raise_syntactic_error(
+                    stack, token, grammar.get_expected_kinds(symbol)
+                )
+            stack.pop()
+            node_type = self.node_types[symbol - grammar.start]
+            if node_type is not None:
+                parent = Node(node_type, parent=parent)
+                if self.syntax_tree is None:
+                    self.syntax_tree = parent
+            _, symbols = grammar.productions[production]
+            stack.extend((child, parent) for child in reversed(symbols))
+        return self.syntax_tree
 
     def _peek_next_token(self) -> AbstractToken | None:
-        if len(self.tokens) == 0:
+        if self.position >= len(self.tokens):
             return None
-        return self.tokens[0]
-
-    def _consume_token(self, token_class: type[AbstractToken]) -> AbstractToken:
-        token = self._peek_next_token()
+        return self.tokens[self.position]
+
+    def _get_expected_tokens(
+        self, stack: list[tuple[int, Node | None]]
+    ) -> dict[TokenType, NonTerminalNodeType]:
+        expected_tokens = {}
+        for kind, token_type in enumerate(self.grammar.terminals):
+            node_type = self._predict_node_type(stack, kind)
+            if node_type is not None:
+                expected_tokens[token_type] = node_type
+        return expected_tokens
+
+    def _predict_node_type(
+        self, stack: list[tuple[int, Node | None]], kind: int
+    ) -> NonTerminalNodeType | None:
+        grammar = self.grammar
+        pending = [
+            (symbol, None if parent is None else parent.name)
+            for symbol, parent in stack
+        ]
+        while len(pending) > 0:
+            symbol, node_type = pending.pop()
+            if grammar.is_terminal(symbol):
+                return node_type if symbol == kind else None
+            production = grammar.get_production(symbol, kind)
+            if production == grammar.NO_PRODUCTION:
+                return None
+            node_type = self.node_types[symbol - grammar.start] or node_type
+            _, symbols = grammar.productions[production]
+            pending.extend((child, node_type) for child in reversed(symbols))
+        return None
+
+    def _raise_syntactic_error(
+        self,
+        stack: list[tuple[int, Node | None]],
+        token: AbstractToken | None,
+        expected_kinds: list[int],
+    ):
+        if self.expected_tokens is None:
+            self.expected_tokens = self._get_expected_tokens(stack)
         if token is None:
             raise SyntacticError(
                 "Unexpected end of tokens",
                 LexemeLocator(-1, -1, -1, -1),
             )
-        if isinstance(token, token_class):
-            return self.tokens.pop(0)
+        expected_names = [
+            "end of tokens" if kind == self.grammar.end
+            else TOKEN_CLASSES[self.grammar.terminals[kind]].__name__
+            for kind in expected_kinds
+        ]
         raise SyntacticError(
             f"Unexpected token: {token.lexeme} "
-            f"(expected: {token_class.__name__})",
+            f"(expected: {' or '.join(expected_names)})",
             token.locator,
         )
-
-    def _set_current_node(self, node: Node):
-        self.previous_node = self.current_node
-        self.current_node = node
-
-    def _statement(self) -> Node:
-        return self._select_statement()
-
-    def _select_statement(self) -> Node:
-        statement_node = Node(NonTerminalNodeType.SELECT_STATEMENT)
-        self.syntax_tree = statement_node
-        self._set_current_node(statement_node)
-        statement_node.children = [self._from()]
-        statement_node.children += (self._select(),)
-        return statement_node
-
-    def _from(self) -> Node:
-        from_node = Node(NonTerminalNodeType.FROM)
-        self._set_current_node(from_node)
-        from_node.children = [
-            Node(self._consume_token(tokens.FromToken)), self._table()
-        ]
-        return from_node
-
-    def _table(self) -> Node:
-        table = Node(NonTerminalNodeType.TABLE)
-        self._set_current_node(table)
-        Node(self._consume_token(tokens.IdentifierToken), parent=table)
-        if isinstance(self._peek_next_token(), tokens.DotToken):
-            Node(self._consume_token(tokens.DotToken), parent=table)
-            Node(self._consume_token(tokens.IdentifierToken), parent=table)
-            if isinstance(self._peek_next_token(), tokens.DotToken):
-                Node(self._consume_token(tokens.DotToken), parent=table)
-                Node(self._consume_token(tokens.IdentifierToken), parent=table)
-        return table
-
-    def _select(self) -> Node:
-        select_node = Node(NonTerminalNodeType.SELECT)
-        self._set_current_node(select_node)
-        select_node.children = [
-            Node(self._consume_token(tokens.SelectToken)),
-            self._column_list()
-        ]
-        return select_node
-
-    def _column_list(self) -> Node:
-        column_list_node = Node(NonTerminalNodeType.COLUMN_LIST)
-        self._set_current_node(column_list_node)
-        columns = [Node(self._consume_token(tokens.IdentifierToken))]
-        while isinstance(self._peek_next_token(), tokens.IdentifierToken):
-            columns.append(Node(self._consume_token(tokens.IdentifierToken)))
-        column_list_node.children = columns
-        return column_list_node
@@ -8,6 +8,8 @@ from dict_compiler import DictCompiler
 app = Flask(__name__)
 app.config.from_object(__name__)
 
+compiler = DictCompiler()
+
 
 @app.route("/", methods=["GET"])
 def index():
@@ -25,29 +27,144 @@ def compile_statement():
     ):
         return "Invalid statement format (expected: string[])", 400
 
-    compiler = DictCompiler()
     statement_stream = StringIO("\n".join(statement))
     try:
         results = compiler.execute(statement_stream)
         str_results = compiler.results_to_str(results)
         return jsonify({"status": "success", "results": str_results})
     except CompilationError as e:
+        return compilation_error_response(e)
+
+
+@app.route("/api/subscribe", methods=["POST"])
+def subscribe():
+    statement = request.get_json().get("statement")
+    if not statement:
+        return "No statement provided", 400
+    if (
+        not isinstance(statement, list) or
+        not all(isinstance(i, str) for i in statement)
+    ):
+        return "Invalid statement format (expected: string[])", 400
+
+    statement_stream = StringIO("\n".join(statement))
+    try:
+        cursor = compiler.subscribe(statement_stream)
+        return jsonify({"status": "success", "cursor": cursor})
+    except CompilationError as e:
+        return compilation_error_response(e)
+
+
+@app.route("/api/poll", methods=["POST"])
+def poll():
+    cursor = request.get_json().get("cursor")
+    if not is_integer(cursor):
+        return "No cursor provided (expected: integer)", 400
+
+    try:
+        delta = compiler.poll(cursor)
+        if delta is None:
+            return f"Unknown cursor '{cursor}'", 404
         return jsonify({
-            "status": "error",
-            "error": {
-                "message": f"{e}",
-                "location": {
-                    "from": {
-                        "line": e.location.line_start,
-                        "ch": e.location.column_start,
-                    },
-                    "to": {
-                        "line": e.location.line_end,
-                        "ch": e.location.column_end,
-                    },
-                }
-            }
+            "status": "success",
+            "full_refresh": delta.full_refresh,
+            "indexes": delta.indexes,
+            "results": compiler.results_to_str(delta.results),
         })
+    except CompilationError as e:
+        return compilation_error_response(e)
+
+
+@app.route("/api/unsubscribe", methods=["POST"])
+def unsubscribe():
+    cursor = request.get_json().get("cursor")
+    if not is_integer(cursor):
+        return "No cursor provided (expected: integer)", 400
+
+    if not compiler.unsubscribe(cursor):
+        return f"Unknown cursor '{cursor}'", 404
+    return jsonify({"status": "success"})
+
+
+@app.route("/api/append", methods=["POST"])
+def append_records():
+    args = request.get_json()
+    table_ids = args.get("table")
+    if not is_valid_table_ids(table_ids):
+        return "Invalid table format (expected: string[] of 1 to 3 ids)", 400
+    records = args.get("records")
+    if (
+        not isinstance(records, list) or
+        not all(isinstance(i, dict) for i in records)
+    ):
+        return "Invalid records format (expected: object[])", 400
+
+    try:
+        table = compiler.get_table(table_ids)
+    except CompilationError as e:
+        return compilation_error_response(e)
+    try:
+        compiler.append_records(table, records)
+    except ValueError as e:
+        return f"{e}", 400
+    return jsonify({"status": "success"})
+
+
+@app.route("/api/update", methods=["POST"])
+def update_record():
+    args = request.get_json()
+    table_ids = args.get("table")
+    if not is_valid_table_ids(table_ids):
+        return "Invalid table format (expected: string[] of 1 to 3 ids)", 400
+    index = args.get("index")
+    if not is_integer(index):
+        return "No index provided (expected: integer)", 400
+    record = args.get("record")
+    if not isinstance(record, dict):
+        return "Invalid record format (expected: object)", 400
+
+    try:
+        table = compiler.get_table(table_ids)
+    except CompilationError as e:
+        return compilation_error_response(e)
+    try:
+        compiler.update_record(table, index, record)
+    except IndexError as e:
+        return f"{e}", 404
+    except ValueError as e:
+        return f"{e}", 400
+    return jsonify({"status": "success"})
+
+
+def is_integer(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def is_valid_table_ids(table_ids) -> bool:
+    return (
+        isinstance(table_ids, list) and
+        1 <= len(table_ids) <= 3 and
+        all(isinstance(i, str) for i in table_ids)
+    )
+
+
+def compilation_error_response(e: CompilationError):
+    return jsonify({
+        "status": "error",
+        "error": {
+            "message": f"{e}",
+            "location": {
+                "from": {
+                    "line": e.location.line_start,
+                    "ch": e.location.column_start,
+                },
+                "to": {
+                    "line": e.location.line_end,
+                    "ch": e.location.column_end,
+                },
+            }
+        }
+    })
 
 
 @app.route("/api/quotation_mark_suggestions", methods=["POST"])
@@ -72,7 +189,7 @@ def get_quotation_mark_suggestions():
     previous_statement = statement[:cursor_line + 1]
     previous_statement[-1] = previous_statement[-1][:cursor_column-1]
     previous_statement_stream = StringIO("\n".join(previous_statement))
-    suggestions = DictCompiler().get_quotation_mark_suggestions(
+    suggestions = compiler.get_quotation_mark_suggestions(
         previous_statement_stream
     )
     return jsonify(suggestions)
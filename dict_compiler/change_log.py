@@ -0,0 +1,20 @@
+from collections import deque
+from itertools import islice
+
+
+class ChangeLog:
+    def __init__(self, max_size: int):
+        self.version = 0
+        self.indexes: deque[int] = deque(maxlen=max_size)
+
+    def record(self, index: int):
+        self.version += 1
+        self.indexes.append(index)
+
+    def get_changed_indexes(self, since_version: int) -> list[int] | None:
+        first_version = self.version - len(self.indexes) + 1
+        if since_version + 1 < first_version:
+            return None
+        return sorted(set(
+            islice(self.indexes, since_version + 1 - first_version, None)
+        ))
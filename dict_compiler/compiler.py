@@ -1,16 +1,41 @@
 import json
+from threading import RLock
 from typing import TextIO
 
 from abstract_compiler import AbstractCompiler
 from abstract_compiler.exceptions import SemanticError, SyntacticError, LexicalError
+from abstract_compiler.lexeme_locator import LexemeLocator
 from abstract_compiler.lexer import Lexer
 from abstract_compiler.parser import Parser, NonTerminalNodeType
+from abstract_compiler.tokens import TokenType
+
+from .change_log import ChangeLog
 
 Table = tuple[str, str, str]
 Result = list[dict]
 
 
+class Subscription:
+    def __init__(
+        self, table: Table, columns: list[str], locator: LexemeLocator
+    ):
+        self.table = table
+        self.columns = columns
+        self.locator = locator
+        self.version: int | None = None
+
+
+class Delta:
+    def __init__(
+        self, full_refresh: bool, indexes: list[int], results: Result
+    ):
+        self.full_refresh = full_refresh
+        self.indexes = indexes
+        self.results = results
+
+
 class DictCompiler(AbstractCompiler[Table, Result]):
+    MAX_CHANGE_LOG_SIZE = 1000
 
     def __init__(
         self, data_file_path: str = "dict_compiler/data.json", *args, **kwargs
@@ -18,6 +43,14 @@ class DictCompiler(AbstractCompiler[Table, Result]):
         super().__init__()
         with open(data_file_path) as file:
             self.data: dict = json.load(file)
+        self.change_logs: dict[Table, ChangeLog] = {}
+        self.subscriptions: dict[int, Subscription] = {}
+        self.next_cursor = 0
+        self.lock = RLock()
+
+    def execute(self, statement: TextIO):
+        with self.lock:
+            return super().execute(statement)
 
     def results_to_str(self, results: Result):
         return json.dumps(results, indent=4)
@@ -29,11 +62,14 @@ class DictCompiler(AbstractCompiler[Table, Result]):
                 if identifier in self.data[database][schema].keys():
                     schema_databases.append((database, schema))
         if len(schema_databases) == 0:
-            raise SemanticError(f"Unknown table '{identifier}'")
+            raise SemanticError(
+                f"Unknown table '{identifier}'", self.current_locator
+            )
         if len(schema_databases) > 1:
             raise SemanticError(
                 f"Multiple tables with name '{identifier}'.\n"
-                "Schema name must be provided"
+                "Schema name must be provided",
+                self.current_locator,
             )
         (database, schema) = schema_databases[0]
         return database, schema, identifier
@@ -86,19 +122,124 @@ class DictCompiler(AbstractCompiler[Table, Result]):
     ) -> Result:
         (database, schema, table_name) = table
         table_content = self.data[database][schema][table_name]
+        return self._select_columns_from_records(
+            table_content, columns, self.current_locator
+        )
+
+    def _select_columns_from_records(
+        self, records: list[dict], columns: list[str], locator: LexemeLocator
+    ) -> Result:
         selected = []
-        for record in table_content:
+        for record in records:
             row = {}
             for column in columns:
                 if column not in record.keys():
-                    raise SemanticError(
-                        f"Unknown column '{column}'",
-                        self.current_locator,
-                    )
+                    raise SemanticError(f"Unknown column '{column}'", locator)
                 row[column] = record[column]
             selected.append(row)
         return selected
 
+    def get_table(self, id_values: list[str]) -> Table:
+        with self.lock:
+            self.current_locator = LexemeLocator(-1, -1, -1, -1)
+            return self.get_table_from_ids(id_values)
+
+    def append_records(self, table: Table, records: list[dict]):
+        with self.lock:
+            (database, schema, table_name) = table
+            table_content = self.data[database][schema][table_name]
+            columns = self._get_column_names(table)
+            if columns is None and len(records) > 0:
+                columns = list(records[0].keys())
+            for record in records:
+                self._validate_record(table_name, columns, record)
+            change_log = self._get_change_log(table)
+            for record in records:
+                table_content.append(record)
+                change_log.record(len(table_content) - 1)
+
+    def update_record(self, table: Table, index: int, record: dict):
+        with self.lock:
+            (database, schema, table_name) = table
+            table_content = self.data[database][schema][table_name]
+            if not 0 <= index < len(table_content):
+                raise IndexError(
+                    f"No record at index {index} in '{table_name}'"
+                )
+            self._validate_record(
+                table_name, self._get_column_names(table), record
+            )
+            table_content[index] = record
+            self._get_change_log(table).record(index)
+
+    def subscribe(self, statement: TextIO) -> int:
+        token_list = Lexer(statement).analyze()
+        syntax_tree = Parser(token_list).parse()
+        with self.lock:
+            table, columns = self._get_table_and_columns(syntax_tree)
+            table_columns = self._get_column_names(table) or []
+            for column in columns:
+                if column not in table_columns:
+                    raise SemanticError(
+                        f"Unknown column '{column}'", self.current_locator
+                    )
+            cursor = self.next_cursor
+            self.next_cursor += 1
+            self.subscriptions[cursor] = Subscription(
+                table, columns, self.current_locator
+            )
+            return cursor
+
+    def unsubscribe(self, cursor: int) -> bool:
+        with self.lock:
+            return self.subscriptions.pop(cursor, None) is not None
+
+    def poll(self, cursor: int) -> Delta | None:
+        with self.lock:
+            subscription = self.subscriptions.get(cursor)
+            if subscription is None:
+                return None
+            (database, schema, table_name) = subscription.table
+            table_content = self.data[database][schema][table_name]
+            change_log = self._get_change_log(subscription.table)
+
+            indexes = None
+            if subscription.version is not None:
+                indexes = change_log.get_changed_indexes(subscription.version)
+            full_refresh = indexes is None
+            if full_refresh:
+                indexes = list(range(len(table_content)))
+
+            results = self._select_columns_from_records(
+                [table_content[index] for index in indexes],
+                subscription.columns,
+                subscription.locator,
+            )
+            subscription.version = change_log.version
+            return Delta(full_refresh, indexes, results)
+
+    def _get_column_names(self, table: Table) -> list[str] | None:
+        (database, schema, table_name) = table
+        table_content = self.data[database][schema][table_name]
+        if len(table_content) == 0:
+            return None
+        return list(table_content[0].keys())
+
+    @staticmethod
+    def _validate_record(
+        table_name: str, columns: list[str] | None, record: dict
+    ):
+        if columns is None or set(record.keys()) != set(columns):
+            raise ValueError(
+                f"Invalid record for table '{table_name}' "
+                f"(expected columns: {', '.join(columns or [])})"
+            )
+
+    def _get_change_log(self, table: Table) -> ChangeLog:
+        if table not in self.change_logs:
+            self.change_logs[table] = ChangeLog(self.MAX_CHANGE_LOG_SIZE)
+        return self.change_logs[table]
+
     def get_quotation_mark_suggestions(
         self, previous_statement: TextIO
     ) -> list[str]:
@@ -113,16 +254,21 @@ class DictCompiler(AbstractCompiler[Table, Result]):
             parser.parse()
         except SyntacticError:
             pass
-        if (
-            parser.previous_node.name == NonTerminalNodeType.COLUMN_LIST
-            or parser.current_node.name == NonTerminalNodeType.COLUMN_LIST
-        ):
-            from_node = parser.syntax_tree.children[0]
-            table_node = from_node.children[1]
-            table = self.get_table_from_node(table_node)
-            return self._get_all_column_names_from_table(table)
-        elif parser.current_node.name == NonTerminalNodeType.TABLE:
-            return self._get_all_table_ids()
+        if parser.position < len(parser.tokens):
+            return []
+        expected_node_type = parser.expected_tokens.get(TokenType.ID)
+        with self.lock:
+            if expected_node_type == NonTerminalNodeType.COLUMN_LIST:
+                from_node = parser.syntax_tree.children[0]
+                table_node = from_node.children[1]
+                self.set_current_locator(table_node)
+                try:
+                    table = self.get_table_from_node(table_node)
+                except SemanticError:
+                    return []
+                return self._get_all_column_names_from_table(table)
+            elif expected_node_type == NonTerminalNodeType.TABLE:
+                return self._get_all_table_ids()
         return []
 
     def _get_all_table_ids(self):
@@ -134,8 +280,5 @@ class DictCompiler(AbstractCompiler[Table, Result]):
         return table_ids
 
     def _get_all_column_names_from_table(self, table: Table) -> list[str]:
-        (database, schema, table_name) = table
-        table_content = self.data[database][schema][table_name]
-        if len(table_content) == 0:
-            return []
-        return [f'{column}"' for column in table_content[0].keys()]
+        columns = self._get_column_names(table) or []
+        return [f'{column}"' for column in columns]